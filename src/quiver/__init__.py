@@ -1,4 +1,4 @@
 # This file marks the directory as a Python package.
-from .quiver import Quiver
+from .quiver import Quiver, read_stdin_tags
 
-__all__ = ["Quiver"]
+__all__ = ["Quiver", "read_stdin_tags"]
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Unified entry point for the Quiver command-line tools.
+
+Usage:
+    python -m quiver <command> [ARGS]...
+
+Only the invoked subcommand's module is imported, so startup cost stays
+that of the single tool being run.
+"""
+
+import importlib
+
+import click
+
+# Subcommand name -> (module, command attribute); modules are imported lazily
+_COMMANDS = {
+    "qvfrompdbs": ("quiver.qvfrompdbs", "qv_from_pdbs"),
+    "qvls": ("quiver.qvls", "list_tags"),
+    "qvextract": ("quiver.qvextract", "extract_pdbs"),
+    "qvextractspecific": ("quiver.qvextractspecific", "extract_selected_pdbs"),
+    "qvscorefile": ("quiver.qvscorefile", "extract_scorefile"),
+    "qvrename": ("quiver.qvrename", "rename_tags"),
+    "qvsplit": ("quiver.qvsplit", "qvsplit"),
+    "qvslice": ("quiver.qvslice", "qvslice"),
+}
+
+
+class LazyGroup(click.Group):
+    def list_commands(self, ctx):
+        return sorted(_COMMANDS)
+
+    def get_command(self, ctx, name):
+        target = _COMMANDS.get(name)
+        if target is None:
+            return None
+        module, attr = target
+        return getattr(importlib.import_module(module), attr)
+
+
+@click.command(cls=LazyGroup)
+def main():
+    """Command-line tools for working with Quiver files."""
+
+
+if __name__ == "__main__":
+    main()
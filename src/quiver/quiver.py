@@ -7,7 +7,26 @@ This Quiver implementation will be just a list of PDB lines in a single file, wi
 Later this can be made more sophisticated by using a proper database, but for now this will be the simplest implementation.
 """
 
+import io
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+def read_stdin_tags():
+    """Read whitespace-separated tags piped on stdin in a single pass.
+
+    Reads the raw fd in 1 MiB batches, bypassing the TextIOWrapper layer,
+    then splits on ASCII whitespace once — no per-line decoding or list
+    churn for large piped tag lists.
+    """
+    buf = bytearray()
+    while True:
+        chunk = os.read(0, 1 << 20)
+        if not chunk:
+            break
+        buf += chunk
+    return [token.decode() for token in buf.split()]
 
 
 class Quiver:
@@ -20,11 +39,51 @@ class Quiver:
         self.fn = filename
         self.tags = self._read_tags()
 
+    @staticmethod
+    def _mmap_readonly(f):
+        """Map an open file read-only, or return None for an empty file."""
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _tag_offsets(mm):
+        """Yield (tag, byte offset) for each QV_TAG header in the mapped file.
+
+        Jumps between matches with mmap.find so the scan runs at C speed
+        instead of iterating the file line by line in Python.
+        """
+        pos = mm.find(b"QV_TAG")
+        while pos != -1:
+            if pos == 0 or mm[pos - 1 : pos] == b"\n":
+                eol = mm.find(b"\n", pos)
+                if eol == -1:
+                    eol = len(mm)
+                yield mm[pos:eol].split()[1].decode(), pos
+                pos = mm.find(b"QV_TAG", eol)
+            else:
+                pos = mm.find(b"QV_TAG", pos + 6)
+
+    @classmethod
+    def scan_tags(cls, filename):
+        """Lazily yield the tags in a Quiver file.
+
+        Streams with O(1) memory, unlike constructing a Quiver object, which
+        materializes the full tag list up front.
+        """
+        if not os.path.exists(filename):
+            return
+        with open(filename, "rb") as f:
+            mm = cls._mmap_readonly(f)
+            if mm is None:
+                return
+            with mm:
+                for tag, _ in cls._tag_offsets(mm):
+                    yield tag
+
     def _read_tags(self):
-        if not os.path.exists(self.fn):
-            return []
-        with open(self.fn, "r") as f:
-            return [line.split()[1] for line in f if line.startswith("QV_TAG")]
+        return list(self.scan_tags(self.fn))
 
     def get_tags(self):
         return list(self.tags)
@@ -73,7 +132,52 @@ class Quiver:
                 raise KeyError(f"Requested tag: {tag} does not exist")
             return pdb_lines
 
+    def iter_structs(self):
+        """Yield (tag, pdb_lines) pairs in a single pass over the file.
+
+        Unlike calling get_pdblines() per tag, this scans the file only once,
+        which matters when extracting every structure from a large file.
+        """
+        if self.mode != "r":
+            raise RuntimeError(
+                "Quiver file must be opened in read mode to allow for reading."
+            )
+
+        with open(self.fn, "r") as f:
+            tag = None
+            pdb_lines = []
+            for line in f:
+                if line.startswith("QV_TAG"):
+                    if tag is not None:
+                        yield tag, pdb_lines
+                    tag = line.split()[1]
+                    pdb_lines = []
+                elif tag is not None and not line.startswith("QV_SCORE"):
+                    pdb_lines.append(line)
+            if tag is not None:
+                yield tag, pdb_lines
+
     def get_struct_list(self, tag_list):
+        struct_bytes, found_tags = self.get_struct_bytes(tag_list)
+        return struct_bytes.decode(), found_tags
+
+    def get_struct_bytes(self, tag_list):
+        """Like get_struct_list but returns the slice as raw bytes.
+
+        Lets callers write the payload straight to a binary stream without a
+        decode/re-encode round trip.
+        """
+        buf = io.BytesIO()
+        found_tags = self.write_structs(tag_list, buf)
+        return buf.getvalue(), found_tags
+
+    def write_structs(self, tag_list, out):
+        """Write the structures for tag_list straight to a binary stream.
+
+        Streams each matching byte range of the mapped file into *out*
+        without materializing the combined slice, and returns the tags that
+        were found, in file order.
+        """
         if self.mode != "r":
             raise RuntimeError(
                 "Quiver file must be opened in read mode to allow for reading."
@@ -81,27 +185,36 @@ class Quiver:
 
         tag_set = set(tag_list)
         found_tags = []
-        struct_lines = []
-        write_mode = False
 
-        with open(self.fn, "r") as f:
-            for line in f:
-                if line.startswith("QV_TAG"):
-                    current_tag = line.split()[1]
-                    write_mode = current_tag in tag_set
-                    if write_mode:
-                        found_tags.append(current_tag)
-                if write_mode:
-                    struct_lines.append(line)
-        return "".join(struct_lines), found_tags
-
-    def split(self, ntags, outdir, prefix):
+        with open(self.fn, "rb") as f:
+            mm = self._mmap_readonly(f)
+            if mm is None:
+                return found_tags
+            with mm:
+                view = memoryview(mm)
+                try:
+                    blocks = list(self._tag_offsets(mm))
+                    for i, (tag, start) in enumerate(blocks):
+                        if tag in tag_set:
+                            end = blocks[i + 1][1] if i + 1 < len(blocks) else len(mm)
+                            found_tags.append(tag)
+                            out.write(view[start:end])
+                finally:
+                    view.release()
+        return found_tags
+
+    def split(self, ntags, outdir, prefix, jobs=1):
         if self.mode != "r":
             raise RuntimeError(
                 "Quiver file must be opened in read mode to allow for reading."
             )
 
         os.makedirs(outdir, exist_ok=True)
+
+        if jobs > 1:
+            self._split_parallel(ntags, outdir, prefix, jobs)
+            return
+
         file_idx = 0
         tag_count = 0
         out_file = None
@@ -124,3 +237,39 @@ class Quiver:
                     out_file.write(line)
             if out_file:
                 out_file.close()
+
+    def _split_parallel(self, ntags, outdir, prefix, jobs):
+        """Write the split chunks concurrently.
+
+        Each chunk is an independent byte range of the source file, so the
+        output files can be written from a thread pool with no coordination.
+        """
+        with open(self.fn, "rb") as f:
+            mm = self._mmap_readonly(f)
+            if mm is None:
+                return
+            with mm:
+                offsets = [offset for _, offset in self._tag_offsets(mm)]
+                starts = offsets[::ntags]
+                ends = starts[1:] + [len(mm)]
+
+                # A single shared view over the map; slicing a memoryview
+                # hands write() the mapped pages directly instead of copying
+                # each chunk into a fresh bytes object first.
+                view = memoryview(mm)
+                try:
+
+                    def write_chunk(file_idx, start, end):
+                        out_path = os.path.join(outdir, f"{prefix}_{file_idx}.qv")
+                        with open(out_path, "wb") as out:
+                            out.write(view[start:end])
+
+                    with ThreadPoolExecutor(max_workers=jobs) as pool:
+                        futures = [
+                            pool.submit(write_chunk, i, start, end)
+                            for i, (start, end) in enumerate(zip(starts, ends))
+                        ]
+                        for future in futures:
+                            future.result()
+                finally:
+                    view.release()
@@ -7,37 +7,74 @@ Usage:
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 import click
-from quiver import Quiver
 
 
 @click.command()
 @click.argument("quiver_file", type=click.Path(exists=True, dir_okay=False))
-def extract_pdbs(quiver_file):
+@click.option(
+    "--jobs",
+    type=int,
+    default=1,
+    help="Number of threads used to write the extracted PDB files (default: 1)",
+)
+def extract_pdbs(quiver_file, jobs):
     """
     Extract all PDB files from a Quiver file.
     """
+    # Imported lazily so --help does not pay the package import cost
+    from quiver import Quiver
+
     qv = Quiver(quiver_file, "r")
 
-    for tag in qv.get_tags():
+    # Snapshot the directory once instead of one stat call per tag
+    existing = {entry.name for entry in os.scandir(".")}
+    extracted = []
+    skipped = []
+    # Collect the per-file messages and emit them in one write at the end
+    messages = []
+
+    def write_struct(outfn, lines):
+        with open(outfn, "w") as f:
+            f.writelines(lines)
+
+    pool = ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    futures = []
+
+    for tag, lines in qv.iter_structs():
         # Sanitize tag to prevent path traversal
         safe_tag = os.path.basename(tag)
         outfn = f"{safe_tag}.pdb"
 
-        if os.path.exists(outfn):
-            click.echo(f"⚠️  File {outfn} already exists, skipping")
+        if outfn in existing:
+            skipped.append(outfn)
+            messages.append(f"⚠️  File {outfn} already exists, skipping")
             continue
 
-        lines = qv.get_pdblines(tag)
-        with open(outfn, "w") as f:
-            f.writelines(lines)
+        if pool is not None:
+            futures.append(pool.submit(write_struct, outfn, lines))
+        else:
+            write_struct(outfn, lines)
+        existing.add(outfn)
+
+        extracted.append(outfn)
+        messages.append(f"✅ Extracted {outfn}")
 
-        click.echo(f"✅ Extracted {outfn}")
+    if pool is not None:
+        for future in futures:
+            future.result()
+        pool.shutdown()
 
+    if messages:
+        click.echo("\n".join(messages))
     click.secho(
-        f"\n🎉 Successfully extracted {qv.size()} PDB files from {quiver_file}",
+        f"\n🎉 Successfully extracted {len(extracted)} PDB files from {quiver_file}",
         fg="green",
     )
+    if skipped:
+        click.secho(f"⚠️  Skipped {len(skipped)} existing file(s)", fg="yellow")
 
 
 if __name__ == "__main__":
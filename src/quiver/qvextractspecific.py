@@ -10,8 +10,9 @@ Usage:
 import os
 import sys
 import stat
+from concurrent.futures import ThreadPoolExecutor
+
 import click
-from quiver import Quiver
 
 
 @click.command()
@@ -24,22 +25,29 @@ from quiver import Quiver
     default=".",
     help="Directory to save extracted PDB files",
 )
-def extract_selected_pdbs(quiver_file, tags, output_dir):
+@click.option(
+    "--jobs",
+    type=int,
+    default=1,
+    help="Number of threads used to write the extracted PDB files (default: 1)",
+)
+def extract_selected_pdbs(quiver_file, tags, output_dir, jobs):
     """
     Extract specific PDB files from a Quiver file.
 
     Tags can be passed as command-line arguments or via stdin (piped).
     """
+    # Imported lazily so --help does not pay the package import cost
+    from quiver import Quiver, read_stdin_tags
+
     tag_buffers = list(tags)
 
     # Check if input is being piped via stdin
     if not sys.stdin.isatty() and stat.S_ISFIFO(os.fstat(0).st_mode):
-        stdin_tags = [line.strip() for line in sys.stdin.readlines()]
-        for line in stdin_tags:
-            tag_buffers.extend(line.split())
+        tag_buffers.extend(read_stdin_tags())
 
-    # Clean and deduplicate tags
-    unique_tags = sorted(set(filter(None, tag_buffers)))
+    # Clean and deduplicate tags, preserving the order they were given in
+    unique_tags = list(dict.fromkeys(filter(None, tag_buffers)))
 
     if not unique_tags:
         click.secho("❗ No tags provided.", fg="red")
@@ -49,31 +57,50 @@ def extract_selected_pdbs(quiver_file, tags, output_dir):
     os.makedirs(output_dir, exist_ok=True)
 
     qv = Quiver(quiver_file, "r")
+    # Snapshot the output directory once instead of one stat call per tag
+    existing = {entry.name for entry in os.scandir(output_dir)}
     extracted_count = 0
+    # Collect the per-file messages and emit them in one write at the end
+    messages = []
+
+    def write_struct(outfn, lines):
+        with open(outfn, "w") as f:
+            f.writelines(lines)
+
+    pool = ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    futures = []
 
     for tag in unique_tags:
         # Sanitize tag to prevent path traversal
         safe_tag = os.path.basename(tag)
         outfn = os.path.join(output_dir, f"{safe_tag}.pdb")
 
-        if os.path.exists(outfn):
-            click.echo(f"⚠️  File {outfn} already exists, skipping")
+        if f"{safe_tag}.pdb" in existing:
+            messages.append(f"⚠️  File {outfn} already exists, skipping")
             continue
 
         try:
             lines = qv.get_pdblines(tag)
         except KeyError:
-            click.secho(
-                f"❌ Could not find tag {tag} in Quiver file, skipping", fg="yellow"
-            )
+            messages.append(f"❌ Could not find tag {tag} in Quiver file, skipping")
             continue
 
-        with open(outfn, "w") as f:
-            f.writelines(lines)
+        if pool is not None:
+            futures.append(pool.submit(write_struct, outfn, lines))
+        else:
+            write_struct(outfn, lines)
+        existing.add(f"{safe_tag}.pdb")
 
-        click.echo(f"✅ Extracted {outfn}")
+        messages.append(f"✅ Extracted {outfn}")
         extracted_count += 1
 
+    if pool is not None:
+        for future in futures:
+            future.result()
+        pool.shutdown()
+
+    if messages:
+        click.echo("\n".join(messages))
     click.secho(
         f"\n🎉 Successfully extracted {extracted_count} PDB file(s) from {quiver_file} to {output_dir}",
         fg="green",
@@ -7,6 +7,7 @@ Usage:
 """
 
 import os
+import sys
 
 import click
 
@@ -21,11 +22,13 @@ def qv_from_pdbs(pdb_files):
 
     Output is printed to stdout.
     """
+    out = sys.stdout.buffer
     for pdbfn in pdb_files:
         pdbtag = os.path.basename(pdbfn).removesuffix(".pdb")
-        click.echo(f"QV_TAG {pdbtag}")
-        with open(pdbfn, "r") as f:
-            click.echo(f.read(), nl=False)
+        out.write(f"QV_TAG {pdbtag}\n".encode())
+        with open(pdbfn, "rb") as f:
+            out.write(f.read())
+    out.flush()
 
 
 if __name__ == "__main__":
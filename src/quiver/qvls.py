@@ -6,8 +6,9 @@ Usage:
     qvls.py <quiver_file>
 """
 
+import sys
+
 import click
-from quiver import Quiver
 
 
 @click.command()
@@ -16,9 +17,15 @@ def list_tags(quiver_file):
     """
     List all tags in the given Quiver file.
     """
-    qv = Quiver(quiver_file, "r")
-    for tag in qv.get_tags():
-        click.echo(tag)
+    # Imported lazily so --help does not pay the package import cost
+    from quiver import Quiver
+
+    # Stream tags straight to the byte buffer: no full tag list in memory
+    # and no per-line flush from click.echo
+    out = sys.stdout.buffer
+    for tag in Quiver.scan_tags(quiver_file):
+        out.write(tag.encode() + b"\n")
+    out.flush()
 
 
 if __name__ == "__main__":
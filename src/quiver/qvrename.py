@@ -5,32 +5,38 @@ Rename the tags in a Quiver file using new tags from stdin or command-line argum
 Usage examples:
     qvls.py my.qv | sed 's/$/_new/' | qvrename.py my.qv > renamed.qv
     qvrename.py my.qv tag1_new tag2_new ... > renamed.qv
+    qvls.py my.qv | sed 's/$/_new/' | qvrename.py --in-place my.qv
 """
 
 import sys
 import os
 import stat
+import tempfile
 import click
-from quiver import Quiver
 
 
 @click.command()
 @click.argument("quiver_file", type=click.Path(exists=True, dir_okay=False))
 @click.argument("new_tags", nargs=-1)
-def rename_tags(quiver_file, new_tags):
+@click.option(
+    "--in-place",
+    is_flag=True,
+    help="Rewrite QUIVER_FILE directly instead of writing to stdout.",
+)
+def rename_tags(quiver_file, new_tags, in_place):
     """
     Rename tags in a Quiver file. New tags are read from arguments or stdin.
     """
-    tag_buffers = list(new_tags)
+    # Imported lazily so --help does not pay the package import cost
+    from quiver import Quiver, read_stdin_tags
+
+    # Only argv entries can be empty; stdin tokens come pre-split on
+    # whitespace, so they never need a second strip/filter pass.
+    tags = [tag for tag in new_tags if tag.strip()]
 
     # Read from stdin if piped
     if not sys.stdin.isatty() and stat.S_ISFIFO(os.fstat(0).st_mode):
-        stdin_lines = sys.stdin.read().splitlines()
-        for line in stdin_lines:
-            tag_buffers.extend(line.strip().split())
-
-    # Filter out empty entries and deduplicate if necessary
-    tags = [tag for tag in tag_buffers if tag.strip()]
+        tags.extend(read_stdin_tags())
 
     qv = Quiver(quiver_file, "r")
     present_tags = qv.get_tags()
@@ -42,34 +48,71 @@ def rename_tags(quiver_file, new_tags):
         )
         sys.exit(1)
 
-    tag_idx = 0
-    with open(quiver_file, "r") as f:
-        while True:
-            line = f.readline()
-            if not line:
-                break
-
-            if line.startswith("QV_TAG"):
-                line = f"QV_TAG {tags[tag_idx]}\n"
-
-                # Read next line (could be QV_SCORE or structure)
-                next_line = f.readline()
-                if next_line.startswith("QV_TAG"):
-                    click.secho(
-                        f"❌ Error: Found two QV_TAG lines in a row. This is not supported. Line: {next_line}",
-                        fg="red",
-                    )
-                    sys.exit(1)
-
-                if next_line.startswith("QV_SCORE"):
-                    parts = next_line.split(" ")
-                    parts[1] = tags[tag_idx]
-                    next_line = " ".join(parts)
-
-                line += next_line
-                tag_idx += 1
-
-            sys.stdout.write(line)
+    if in_place:
+        # Rewrite next to the source file so os.replace stays atomic
+        out_dir = os.path.dirname(os.path.abspath(quiver_file)) or "."
+        out_fd, tmp_path = tempfile.mkstemp(prefix=".qvrename_", dir=out_dir)
+        out = os.fdopen(out_fd, "w")
+    else:
+        out = sys.stdout
+        tmp_path = None
+
+    committed = False
+    try:
+        tag_idx = 0
+        # Buffer output and flush in large chunks instead of one write per line
+        out_chunks = []
+        pending = 0
+        with open(quiver_file, "r") as f:
+            while True:
+                line = f.readline()
+                if not line:
+                    break
+
+                if line.startswith("QV_TAG"):
+                    line = f"QV_TAG {tags[tag_idx]}\n"
+
+                    # Read next line (could be QV_SCORE or structure)
+                    next_line = f.readline()
+                    if next_line.startswith("QV_TAG"):
+                        click.secho(
+                            f"❌ Error: Found two QV_TAG lines in a row. This is not supported. Line: {next_line}",
+                            fg="red",
+                        )
+                        sys.exit(1)
+
+                    if next_line.startswith("QV_SCORE"):
+                        parts = next_line.split(" ")
+                        parts[1] = tags[tag_idx]
+                        next_line = " ".join(parts)
+
+                    line += next_line
+                    tag_idx += 1
+
+                out_chunks.append(line)
+                pending += len(line)
+                if pending >= (1 << 20):
+                    out.write("".join(out_chunks))
+                    out_chunks.clear()
+                    pending = 0
+
+        if out_chunks:
+            out.write("".join(out_chunks))
+
+        if in_place:
+            out.flush()
+            os.fsync(out.fileno())
+            out.close()
+            os.replace(tmp_path, quiver_file)
+            committed = True
+    finally:
+        if tmp_path is not None and not committed:
+            if not out.closed:
+                out.close()
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
 
 if __name__ == "__main__":
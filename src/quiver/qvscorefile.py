@@ -6,10 +6,10 @@ Usage:
     qvscorefile.py mydesigns.qv
 """
 
+import csv
 import os
 import sys
 import click
-import pandas as pd
 
 
 @click.command()
@@ -46,10 +46,20 @@ def extract_scorefile(qvfile):
         click.secho("❌ No score lines found in Quiver file.", fg="red", err=True)
         sys.exit(1)
 
-    df = pd.DataFrame.from_records(records)
+    # Columns in first-seen order, matching the old DataFrame behaviour
+    fieldnames = list(dict.fromkeys(key for record in records for key in record))
 
     outfn = os.path.splitext(qvfile)[0] + ".sc"
-    df.to_csv(outfn, sep="\t", na_rep="NaN", index=False)
+    with open(outfn, "w", newline="") as f:
+        writer = csv.DictWriter(
+            f,
+            fieldnames=fieldnames,
+            delimiter="\t",
+            restval="NaN",
+            lineterminator="\n",
+        )
+        writer.writeheader()
+        writer.writerows(records)
 
     click.secho(f"✅ Scorefile written to: {outfn}", fg="green")
 
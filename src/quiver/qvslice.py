@@ -9,7 +9,6 @@ Usage:
 
 import sys
 import click
-from quiver import Quiver
 
 
 @click.command()
@@ -20,12 +19,14 @@ def qvslice(quiver_file, tags):
     Extract selected TAGS from QUIVER_FILE and output to stdout.
     If no TAGS are provided as arguments, they are read from stdin.
     """
+    # Imported lazily so --help does not pay the package import cost
+    from quiver import Quiver, read_stdin_tags
+
     tag_list = list(tags)
 
     # ✅ Read tags from stdin if no arguments are provided
     if not tag_list and not sys.stdin.isatty():
-        stdin_data = sys.stdin.read()
-        tag_list.extend(stdin_data.strip().split())
+        tag_list.extend(read_stdin_tags())
 
     # ✅ Clean and validate tag list
     tag_list = [tag.strip() for tag in tag_list if tag.strip()]
@@ -38,16 +39,18 @@ def qvslice(quiver_file, tags):
         sys.exit(1)
 
     qv = Quiver(quiver_file, "r")
-    qv_lines, found_tags = qv.get_struct_list(tag_list)
+
+    # Stream matching byte ranges straight to stdout; the slice is never
+    # materialized in memory
+    out = sys.stdout.buffer
+    found_tags = qv.write_structs(tag_list, out)
+    out.flush()
 
     # Warn about missing tags
     missing_tags = [tag for tag in tag_list if tag not in found_tags]
     for tag in missing_tags:
         click.secho(f"⚠️  Tag not found in Quiver file: {tag}", fg="yellow", err=True)
 
-    # Output sliced content
-    click.echo(qv_lines, nl=False)
-
 
 if __name__ == "__main__":
     qvslice()
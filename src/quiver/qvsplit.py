@@ -9,7 +9,6 @@ Usage:
 """
 
 import click
-from quiver import Quiver
 
 
 @click.command()
@@ -24,10 +23,19 @@ from quiver import Quiver
     default=".",
     help="Directory to save the split files (default: current directory)",
 )
-def qvsplit(file, ntags, prefix, output_dir):
+@click.option(
+    "--jobs",
+    type=int,
+    default=1,
+    help="Number of threads used to write the split files (default: 1)",
+)
+def qvsplit(file, ntags, prefix, output_dir, jobs):
     """
     Split a Quiver FILE into multiple files, each with NTAGS tags.
     """
+    # Imported lazily so --help does not pay the package import cost
+    from quiver import Quiver
+
     if ntags <= 0:
         click.secho("❌ NTAGS must be a positive integer.", fg="red", err=True)
         raise click.Abort()
@@ -36,7 +44,7 @@ def qvsplit(file, ntags, prefix, output_dir):
     click.secho(f"🔪 Splitting into chunks of {ntags} tags...", fg="green")
 
     q = Quiver(file, "r")
-    q.split(ntags, output_dir, prefix)
+    q.split(ntags, output_dir, prefix, jobs=max(1, jobs))
 
     click.secho(f"✅ Files written to {output_dir} with prefix '{prefix}'", fg="green")
 
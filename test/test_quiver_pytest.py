@@ -8,14 +8,12 @@ are lost during manipulation of the Quiver file.
 
 import sys
 import os
+import csv
+import mmap
+import operator
 import math
-import uuid
-try:
-    import pandas as pd
-    HAS_PANDAS = True
-except ImportError:
-    HAS_PANDAS = False
-import glob
+import shutil
+import tempfile
 import subprocess  # For running external scripts
 import filecmp  # For comparing files more directly
 import random  # For selecting random tags
@@ -60,54 +58,25 @@ def basedir():
 def input_pdb_files(basedir):
     """Return the list of input PDB files for tests."""
     pdb_dir = os.path.join(basedir, "test", "input_for_tests")
-    files = glob.glob(os.path.join(pdb_dir, "*.pdb"))
+    files = [e.path for e in os.scandir(pdb_dir) if e.name.endswith(".pdb")]
     # 절대 경로를 반환하는지 확인
     return [os.path.abspath(f) for f in files]
 
 
-@pytest.fixture
-def input_qv_file(basedir, tmp_path, input_pdb_files):
+@pytest.fixture(scope="session")  # 세션당 한 번만 생성하여 모든 테스트에서 공유
+def input_qv_file(basedir, tmp_path_factory, input_pdb_files):
     """Creates a test Quiver file from input PDBs in a temporary location."""
     if not input_pdb_files:
         pytest.skip("No input PDB files found for creating test Quiver file.")
 
-    qv_path = tmp_path / "test.qv"
-    # input_pdb_files 리스트를 공백으로 구분하고 각 파일을 따옴표로 감싼 문자열로 변환
-    pdb_files_list_str = " ".join(f'"{f}"' for f in input_pdb_files)
-    script_path = os.path.join(basedir, "src", "quiver", "qvfrompdbs.sh")
-
-    # 스크립트 존재 여부 확인
-    if not os.path.exists(script_path):
-        pytest.fail(f"Script not found: {script_path}")
-    if not os.access(script_path, os.X_OK):
-        pytest.fail(f"Script is not executable: {script_path}")
-
-    cmd = f"{script_path} {pdb_files_list_str}"
-    # 표준 출력을 파일로 리디렉션
-    try:
-        with open(qv_path, "w") as f_out:
-            # shell=True는 보안 위험이 있을 수 있으나, 여기서는 쉘 스크립트 실행 및 파일 목록 전달을 위해 사용
-            # check=True는 명령 실패 시 예외 발생
-            # stderr=subprocess.PIPE 추가하여 오류 메시지 캡처
-            subprocess.run(
-                cmd,
-                shell=True,
-                check=True,
-                stdout=f_out,
-                stderr=subprocess.PIPE,
-                cwd=tmp_path,
-                text=True,
-                encoding="utf-8",
-            )
-    except subprocess.CalledProcessError as e:
-        # 실패 시 stderr 출력
-        print(f"Error running qvfrompdbs.sh: {e}")
-        print(f"Stderr:\n{e.stderr}")
-        pytest.fail(f"qvfrompdbs.sh failed: {e}")
-    except FileNotFoundError as e:
-        pytest.fail(
-            f"Failed to run command. Is the script path correct and executable? {e}"
-        )
+    qv_path = tmp_path_factory.mktemp("qv_fixture") / "test.qv"
+    # 쉘 파이프라인 대신 페이로드를 한 버퍼로 모아 write 한 번으로 기록
+    chunks = []
+    for pdb in input_pdb_files:
+        tag = pathlib.Path(pdb).stem
+        chunks.append(f"QV_TAG {tag}\n".encode())
+        chunks.append(pathlib.Path(pdb).read_bytes())
+    qv_path.write_bytes(b"".join(chunks))
 
     # 생성된 파일이 비어있지 않은지 간단히 확인
     assert qv_path.exists() and qv_path.stat().st_size > 0, (
@@ -116,6 +85,12 @@ def input_qv_file(basedir, tmp_path, input_pdb_files):
     return qv_path
 
 
+@pytest.fixture(scope="session")  # 태그 목록을 세션당 한 번만 파싱
+def input_qv_tags(input_qv_file):
+    """Return the tag list of the shared Quiver fixture."""
+    return Quiver(str(input_qv_file), "r").get_tags()
+
+
 @pytest.fixture(scope="session")  # 세션 범위로 변경
 def scored_qv_file(basedir):
     """Returns the path to the pre-scored input Quiver file."""
@@ -125,6 +100,12 @@ def scored_qv_file(basedir):
     return file_path
 
 
+def _stems(dir_path, suffix=".pdb"):
+    """suffix로 끝나는 항목의 stem 집합을 os.scandir로 수집한다 (Path 객체 없이)."""
+    with os.scandir(dir_path) as it:
+        return {e.name[: -len(suffix)] for e in it if e.name.endswith(suffix)}
+
+
 # --- Test Functions ---
 
 
@@ -269,7 +250,7 @@ def test_qvls(basedir, tmp_path, input_pdb_files, input_qv_file):
     print("Passed qvls test")
 
 
-def test_qvslice(basedir, tmp_path, input_pdb_files, input_qv_file):
+def test_qvslice(basedir, tmp_path, input_pdb_files, input_qv_file, input_qv_tags):
     """Test slicing a Quiver file and extracting from the slice."""
     if not input_pdb_files:
         pytest.skip("No input PDB files for testing qvslice.")
@@ -286,22 +267,16 @@ def test_qvslice(basedir, tmp_path, input_pdb_files, input_qv_file):
     if not os.path.exists(extract_script):
         pytest.fail(f"Script not found: {extract_script}")
 
-    # Get all tags and select 5 random tags
-    try:
-        q = Quiver(str(input_qv_file), "r")
-        all_tags = q.get_tags()
-        # q.close() 제거됨
-    except Exception as e:
-        pytest.fail(f"Failed to read tags from Quiver file {input_qv_file}: {e}")
+    # Get all tags (cached per session) and select 5 random tags
+    all_tags = input_qv_tags
 
     assert len(all_tags) > 0, "No tags found in the input Quiver file."
     num_to_select = min(5, len(all_tags))
-    selected_tags = random.sample(all_tags, num_to_select)
+    # 시드를 고정해 매 실행 동일한 태그를 선택 (캐시·재현성 확보)
+    selected_tags = random.Random("qvslice").sample(all_tags, num_to_select)
 
-    # Write selected tags to file
-    with open(tags_to_slice_path, "w") as f:
-        for tag in selected_tags:
-            f.write(f"{tag}\n")
+    # Write selected tags as one pre-encoded buffer
+    tags_to_slice_path.write_bytes("".join(f"{tag}\n" for tag in selected_tags).encode())
 
     # Run qvslice using the tag file as input
     slice_cmd = (
@@ -338,8 +313,7 @@ def test_qvslice(basedir, tmp_path, input_pdb_files, input_qv_file):
         pytest.fail(f"qvextract.py failed on sliced file: {e}")
 
     # Verify extracted files
-    extracted_files = list(tmp_path.glob("*.pdb"))
-    extracted_tags = {file.stem for file in extracted_files}
+    extracted_tags = _stems(tmp_path)
 
     assert set(selected_tags) == extracted_tags, (
         f"Tags from sliced extract mismatch. Expected: {set(selected_tags)}, Got: {extracted_tags}"
@@ -452,11 +426,11 @@ def test_qvsplit(basedir, tmp_path, input_pdb_files, input_qv_file):
             print(f"Stderr:\n{e.stderr}")
             pytest.fail(f"qvextract.py failed on split file: {e}")
 
-        # Find newly extracted PDBs associated *only* with this split file's tags
-        current_split_extracted_files = {
-            f for f in split_output_dir.glob("*.pdb") if f.stem in local_tags
+        # The split's tags are already known from its header lines, so check
+        # those files directly instead of re-scanning the directory per split
+        current_split_tags = {
+            tag for tag in local_tags if (split_output_dir / f"{tag}.pdb").exists()
         }
-        current_split_tags = {f.stem for f in current_split_extracted_files}
         all_extracted_tags_from_splits.update(current_split_tags)
 
         # Compare extracted files with originals for this split
@@ -479,7 +453,31 @@ def test_qvsplit(basedir, tmp_path, input_pdb_files, input_qv_file):
     print("Passed qvsplit test")
 
 
-@pytest.mark.skipif(not HAS_PANDAS, reason="pandas not installed")
+def _read_stripped_lines(path):
+    """mmap으로 파일을 매핑해 공백이 제거된 비어있지 않은 줄 목록을 돌려준다."""
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return []
+        with mm:
+            return [ln.strip() for ln in mm[:].split(b"\n") if ln.strip()]
+
+
+def _read_scorefile(path):
+    """탭 구분 scorefile을 {tag: 나머지 열 튜플}로 읽는다.
+
+    tag를 제외한 열들을 미리 컴파일된 itemgetter로 뽑아 저장하므로 행
+    비교가 열 단위 루프 대신 튜플 비교 한 번으로 끝난다.
+    """
+    with open(path, newline="") as f:
+        reader = csv.reader(f, delimiter="\t")
+        header = next(reader)
+        tag_idx = header.index("tag")
+        getter = operator.itemgetter(*(i for i in range(len(header)) if i != tag_idx))
+        return {row[tag_idx]: getter(row) for row in reader}
+
+
 def test_qvrename(basedir):
     """
     Test that qvrename correctly renames the entries of a Quiver file.
@@ -492,136 +490,111 @@ def test_qvrename(basedir):
     3) Checks that the score lines are also renamed
     """
 
-    # Go into the test directory
-    os.chdir(f"{basedir}/test")
-
-    # Create a temporary directory
-    os.system("mkdir -p do_qvrename")
-
-    os.chdir("do_qvrename")
+    # Create a temporary directory (절대 경로만 사용, chdir 없음)
+    test_dir = f"{basedir}/test/do_qvrename"
+    inpdbdir = f"{test_dir}/input_pdbs"
+    os.makedirs(inpdbdir, exist_ok=True)
 
     # Get the input Quiver filepath
     qvpath = f"{basedir}/test/input_for_tests/designs_scored.qv"
-    if not os.path.exists("input_pdbs"):
-        os.mkdir("input_pdbs")
-    os.chdir("input_pdbs")
-
-    # Extract the PDB files from the Quiver file
-    os.system(f"{basedir}/src/quiver/qvextract.py {qvpath}")
 
-    # Store current path
-    inpdbdir = os.getcwd()
-
-    os.chdir(f"{basedir}/test/do_qvrename")
+    # Extract the PDB files from the Quiver file (qvextract writes to cwd)
+    os.system(f"cd {inpdbdir} && {basedir}/src/quiver/qvextract.py {qvpath}")
 
     # Get the Quiver tags
     inqv = Quiver(qvpath, "r")
     tags = inqv.get_tags()
 
-    # Make a random set of names to rename the entries to
-    newtags = [f"{uuid.uuid4()}" for tag in tags]
+    # Make a deterministic set of unique names to rename the entries to
+    rng = random.Random("qvrename")
+    newtags = [f"renamed_{rng.getrandbits(128):032x}" for tag in tags]
 
-    # Write the new tags to a file
-    with open("newtags.txt", "w") as f:
-        for tag in newtags:
-            f.write(f"{tag}\n")
+    # Write the new tags as one pre-encoded buffer
+    pathlib.Path(f"{test_dir}/newtags.txt").write_bytes(
+        "".join(f"{tag}\n" for tag in newtags).encode()
+    )
 
     # Run qvrename
     os.system(
-        f"cat newtags.txt | {basedir}/src/quiver/qvrename.py {qvpath} > renamed.qv"
+        f"cat {test_dir}/newtags.txt | {basedir}/src/quiver/qvrename.py {qvpath} "
+        f"> {test_dir}/renamed.qv"
     )
 
-    # Run qvextract
-    os.system(f"{basedir}/src/quiver/qvextract.py renamed.qv")
+    # Run qvextract (writes to cwd)
+    os.system(f"cd {test_dir} && {basedir}/src/quiver/qvextract.py renamed.qv")
 
     # Pair the old tags with the new tags and assert that the PDB files are the same
-    # other than the name
+    # other than the name; 줄 목록은 mmap 기반 헬퍼로 읽는다
     for idx in range(len(tags)):
-        # Get the new PDB file
-        currpdb = f"{newtags[idx]}.pdb"
-        with open(currpdb, "r") as f:
-            currpdblines = [line.strip() for line in f.readlines()]
-
-        # Get the original PDB file
+        currpdb = f"{test_dir}/{newtags[idx]}.pdb"
         pdb = f"{inpdbdir}/{tags[idx]}.pdb"
 
-        # Get the PDB lines
-        with open(pdb, "r") as f:
-            pdblines = [line.strip() for line in f.readlines()]
-
         # Check that the two files are identical
-        assert currpdblines == pdblines, f"PDB file {currpdb} does not match {pdb}"
+        assert _read_stripped_lines(currpdb) == _read_stripped_lines(pdb), (
+            f"PDB file {currpdb} does not match {pdb}"
+        )
 
     # Now compare the score lines of the two Quiver files
     # Get the score lines of the original Quiver file
     os.system(f"{basedir}/src/quiver/qvscorefile.py {qvpath}")
     ogsc = qvpath.split(".")[0] + ".sc"
 
-    ogdf = pd.read_csv(ogsc, sep="\t")
-
     # Get the score lines of the new Quiver file
-    os.system(f"{basedir}/src/quiver/qvscorefile.py renamed.qv")
-    newsc = "renamed.sc"
+    os.system(f"{basedir}/src/quiver/qvscorefile.py {test_dir}/renamed.qv")
+    newsc = f"{test_dir}/renamed.sc"
 
-    newdf = pd.read_csv(newsc, sep="\t")
+    # Index both scorefiles by tag once so each row lookup is O(1)
+    og_scores = _read_scorefile(ogsc)
+    new_scores = _read_scorefile(newsc)
 
     # Pair the old tags with the new tags and assert that the score lines are the same
     # other than the name
-    for idx in range(len(tags)):
-        # Get the old score line with 'tag' column equal to the old tag
-        oldrow = ogdf.loc[ogdf["tag"] == tags[idx]]
-
-        # Get the new score line with 'tag' column equal to the new tag
-        newrow = newdf.loc[newdf["tag"] == newtags[idx]]
-
-        # Check that the two rows are identical except for the tag
-        for key in oldrow.keys():
-            if key == "tag":
-                continue
-            assert oldrow[key].values[0] == newrow[key].values[0], (
-                f"Score line {idx} does not match between old and new Quiver files"
-            )
+    for idx, (old_tag, new_tag) in enumerate(zip(tags, newtags)):
+        assert og_scores[old_tag] == new_scores[new_tag], (
+            f"Score line {idx} does not match between old and new Quiver files"
+        )
 
     # Clean up
-    os.chdir(f"{basedir}")
-    os.system(f"rm -r {basedir}/test/do_qvrename")
+    shutil.rmtree(test_dir, ignore_errors=True)
 
 
 def test_qvextractspecific(basedir):
-    os.chdir(f"{basedir}/test")
-    test_dir = os.path.join(basedir, "test", "do_qvextractspecific")
-
-    # 디렉토리 생성 방식 변경
-    os.makedirs(test_dir, exist_ok=True)
-    os.chdir(test_dir)
-
-    # 기존 *.pdb 파일 삭제
-    for f in glob.glob("*.pdb"):
-        os.remove(f)
+    # 매 실행마다 새 임시 디렉토리 생성 (남은 파일 정리 불필요)
+    test_dir = tempfile.mkdtemp(
+        prefix="do_qvextractspecific_", dir=os.path.join(basedir, "test")
+    )
 
-    # Quiver 파일 생성
+    # Quiver 파일 생성 (절대 경로만 사용, chdir 없음)
     os.system(
-        f"{basedir}/src/quiver/qvfrompdbs.sh {basedir}/test/input_for_tests/*.pdb > test.qv"
+        f"{basedir}/src/quiver/qvfrompdbs.sh {basedir}/test/input_for_tests/*.pdb "
+        f"> {test_dir}/test.qv"
     )
 
     # 태그 추출
-    os.system(f"{basedir}/src/quiver/qvls.py test.qv | shuf | head -n 5 > tags.txt")
+    os.system(
+        f"{basedir}/src/quiver/qvls.py {test_dir}/test.qv | shuf | head -n 5 "
+        f"> {test_dir}/tags.txt"
+    )
 
     # Extraction 명령어 수정 (--output-dir 추가)
     os.system(
-        f"cat tags.txt | {basedir}/src/quiver/qvextractspecific.py test.qv --output-dir {test_dir}"
+        f"cat {test_dir}/tags.txt | {basedir}/src/quiver/qvextractspecific.py "
+        f"{test_dir}/test.qv --output-dir {test_dir}"
     )
 
-    with open("tags.txt", "r") as f:
+    with open(f"{test_dir}/tags.txt", "r") as f:
         lines = [line.strip() for line in f.readlines()]
 
     # 파일 존재 여부 확인
-    missing = [tag for tag in lines if not os.path.exists(f"{tag}.pdb")]
+    missing = [tag for tag in lines if not os.path.exists(f"{test_dir}/{tag}.pdb")]
     assert not missing, f"Missing PDBs: {missing}"
 
     # Get list of pdbs in this directory
-    pdbs = glob.glob("*.pdb")
-    pdb_tags = [os.path.basename(pdb)[:-4] for pdb in pdbs]
+    pdb_tags = [
+        entry.name[:-4]
+        for entry in os.scandir(test_dir)
+        if entry.name.endswith(".pdb")
+    ]
 
     assert set(lines) == set(pdb_tags), (
         f"lines: {lines}\npdb_tags: {pdb_tags}\nqvextractspecific did not return the correct PDB files"
@@ -629,7 +602,7 @@ def test_qvextractspecific(basedir):
 
     for tag in lines:
         # Get the current PDB file
-        currpdb = f"{tag}.pdb"
+        currpdb = f"{test_dir}/{tag}.pdb"
         with open(currpdb, "r") as f:
             currpdblines = [line.strip() for line in f.readlines()]
 
@@ -644,8 +617,7 @@ def test_qvextractspecific(basedir):
         assert currpdblines == pdblines, f"PDB file {currpdb} does not match {pdb}"
 
     # Clean up
-    os.chdir(f"{basedir}")
-    os.system(f"rm -r {basedir}/test/do_qvextractspecific")
+    shutil.rmtree(test_dir, ignore_errors=True)
 
 def test_quiver_invalid_mode():
     """Test that Quiver raises ValueError when initialized with an invalid mode."""